@@ -1,5 +1,7 @@
-from fastapi import FastAPI, HTTPException, Path, Depends
+from fastapi import FastAPI, HTTPException, Path
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Dict, List, Optional, Union
 
 from .services.scheduler import SchedulerService
@@ -20,7 +22,7 @@ from .utils.exceptions import (
 )
 from .utils.logging import logger
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 scheduler = SchedulerService()
 
 def configure_cors(app: FastAPI, settings: Settings):
@@ -33,14 +35,18 @@ def configure_cors(app: FastAPI, settings: Settings):
         allow_headers=["*"],
     )
 
+def configure_compression(app: FastAPI):
+    """Configure gzip compression for larger responses"""
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Configure application
 settings = get_settings()
 configure_cors(app, settings)
+configure_compression(app)
 
 @app.post("/groups/bulk")
 async def bulk_add_groups(
-    data: BulkGroupsCreate,
-    settings: Settings = Depends(get_settings)
+    data: BulkGroupsCreate
 ) -> Dict[str, Dict[str, bool]]:
     """Add multiple groups at once"""
     logger.info("Processing bulk group creation request")
@@ -53,8 +59,7 @@ async def bulk_add_groups(
 @app.post("/groups/{group_id}/people")
 async def add_person_to_group(
     group_id: Union[str, int],
-    person: PersonCreate,
-    settings: Settings = Depends(get_settings)
+    person: PersonCreate
 ) -> Dict[str, str]:
     """Add a person to a group"""
     try:
@@ -70,8 +75,7 @@ async def add_person_to_group(
 
 @app.post("/groups/people/bulk")
 async def bulk_add_people_to_groups(
-    data: BulkPeopleAssignment,
-    settings: Settings = Depends(get_settings)
+    data: BulkPeopleAssignment
 ) -> Dict[str, Dict[str, List[str]]]:
     """Add multiple people to multiple groups at once"""
     logger.info("Processing bulk people assignment request")
@@ -83,15 +87,14 @@ async def bulk_add_people_to_groups(
         }
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error processing bulk assignment: {str(e)}")
+    except Exception:
+        logger.exception("Error processing bulk assignment")
         raise HTTPException(status_code=500, detail="Internal server error processing bulk assignment")
 
 @app.delete("/group/{group_id}/person/{name}")
 async def remove_person(
     group_id: str = Path(..., description="Group ID - can be any string"),
-    name: str = Path(..., description="Person name"),
-    settings: Settings = Depends(get_settings)
+    name: str = Path(..., description="Person name")
 ) -> Dict[str, str]:
     """Remove a person from a group"""
     try:
@@ -102,8 +105,7 @@ async def remove_person(
 
 @app.delete("/group/{group_id}")
 async def delete_group(
-    group_id: str = Path(..., description="Group ID - can be any string"),
-    settings: Settings = Depends(get_settings)
+    group_id: str = Path(..., description="Group ID - can be any string")
 ) -> Dict[str, str]:
     """Delete a group"""
     try:
@@ -113,17 +115,14 @@ async def delete_group(
         raise HTTPException(status_code=404, detail=str(e))
 
 @app.get("/groups")
-async def get_groups(
-    settings: Settings = Depends(get_settings)
-) -> Dict[str, Group]:
+async def get_groups() -> Dict[str, Group]:
     """Get all groups and their members"""
     return scheduler.get_groups()
 
 @app.post("/schedule/{year}/{month}")
 async def generate_schedule(
     year: int,
-    month: int,
-    settings: Settings = Depends(get_settings)
+    month: int
 ) -> Schedule:
     """Generate a monthly schedule"""
     try:
@@ -132,9 +131,7 @@ async def generate_schedule(
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/schedule")
-async def get_schedule(
-    settings: Settings = Depends(get_settings)
-) -> Schedule:
+async def get_schedule() -> Schedule:
     """Get the current schedule"""
     schedule = scheduler.get_schedule()
     if not schedule:
@@ -143,8 +140,7 @@ async def get_schedule(
 
 @app.get("/schedule/person/{name}")
 async def get_person_schedule(
-    name: str,
-    settings: Settings = Depends(get_settings)
+    name: str
 ) -> Dict[str, List[str]]:
     """Get a person's schedule"""
     dates = scheduler.get_person_schedule(name)
@@ -153,19 +149,14 @@ async def get_person_schedule(
     return {"dates": dates}
 
 @app.delete("/reset")
-async def reset_data(
-    settings: Settings = Depends(get_settings)
-) -> Dict[str, str]:
+async def reset_data() -> Dict[str, str]:
     """Reset all data"""
-    global scheduler
-    scheduler = SchedulerService()
+    scheduler.reset()
     logger.info("Reset all application data")
     return {"message": "All data has been reset"}
 
 @app.get("/")
-async def read_root(
-    settings: Settings = Depends(get_settings)
-) -> Dict[str, str]:
+async def read_root() -> Dict[str, str]:
     """Root endpoint"""
     return {
         "message": f"Welcome to {settings.app_name}",
@@ -1,21 +1,37 @@
 from typing import Dict, List, Optional, Set, Union
 from datetime import datetime, timedelta
 from calendar import monthrange
+from functools import lru_cache
 from ..models.schemas import Person, Group, Schedule
 from ..utils.exceptions import GroupNotFoundException, PersonNotFoundException, InsufficientGroupMembersError, InvalidScheduleError
 from ..utils.logging import logger
 import random
 
+@lru_cache(maxsize=256)
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in the given month"""
+    return monthrange(year, month)[1]
+
 class SchedulerService:
     def __init__(self):
         self._groups: Dict[Union[str, int], Group] = {}
+        self._member_names: Dict[Union[str, int], Set[str]] = {}
         self._current_schedule: Optional[Schedule] = None
+        self._person_dates: Dict[str, List[str]] = {}
+
+    def reset(self) -> None:
+        """Clear all groups and the current schedule"""
+        self._groups.clear()
+        self._member_names.clear()
+        self._current_schedule = None
+        self._person_dates = {}
 
     def add_group(self, group_id: Union[str, int]) -> bool:
         """Add a new group"""
         if group_id in self._groups:
             return False
         self._groups[group_id] = Group(id=group_id)
+        self._member_names[group_id] = set()
         return True
 
     def bulk_add_groups(self, group_ids: List[Union[str, int]]) -> Dict[Union[str, int], bool]:
@@ -30,6 +46,7 @@ class SchedulerService:
         if group_id not in self._groups:
             raise GroupNotFoundException(f"Group {group_id} not found")
         del self._groups[group_id]
+        del self._member_names[group_id]
 
     def add_person_to_group(
         self,
@@ -51,13 +68,14 @@ class SchedulerService:
             raise ValueError("max_days must be at least 1")
 
         # Check if person already exists in the group
-        group = self._groups[group_id]
-        if any(member.name == name for member in group.members):
+        member_names = self._member_names[group_id]
+        if name in member_names:
             raise ValueError(f"Person {name} already exists in group {group_id}")
 
         # Add person to group
         person = Person(name=name, min_days=min_days, max_days=max_days)
-        group.members.append(person)
+        self._groups[group_id].members.append(person)
+        member_names.add(name)
 
     def bulk_add_people_to_groups(
         self,
@@ -92,13 +110,16 @@ class SchedulerService:
         if group_id not in self._groups:
             raise GroupNotFoundException(f"Group {group_id} not found")
 
+        member_names = self._member_names[group_id]
+        if name not in member_names:
+            raise PersonNotFoundException(f"Person {name} not found in group {group_id}")
+
         group = self._groups[group_id]
         for i, member in enumerate(group.members):
             if member.name == name:
                 group.members.pop(i)
-                return
-
-        raise PersonNotFoundException(f"Person {name} not found in group {group_id}")
+                break
+        member_names.discard(name)
 
     def get_groups(self) -> Dict[Union[str, int], Group]:
         """Get all groups"""
@@ -110,14 +131,7 @@ class SchedulerService:
 
     def get_person_schedule(self, name: str) -> List[str]:
         """Get a person's schedule"""
-        if not self._current_schedule:
-            return []
-
-        dates = []
-        for date, names in self._current_schedule.assignments.items():
-            if name in names:
-                dates.append(date)
-        return sorted(dates)
+        return list(self._person_dates.get(name, []))
 
     def generate_monthly_schedule(self, year: int, month: int) -> Schedule:
         """Generate a monthly schedule"""
@@ -126,7 +140,7 @@ class SchedulerService:
             raise InvalidScheduleError("No groups available for scheduling")
 
         # Get the number of days in the month
-        _, num_days = monthrange(year, month)
+        num_days = _days_in_month(year, month)
 
         # Initialize schedule
         schedule = Schedule(
@@ -136,31 +150,55 @@ class SchedulerService:
             groups=self._groups
         )
 
-        # Generate assignments for each day
-        for day in range(1, num_days + 1):
-            date_str = f"{year}-{month:02d}-{day:02d}"
-            schedule.assignments[date_str] = []
+        # Reverse index of name -> dates, built in date order
+        person_dates: Dict[str, List[str]] = {}
 
-            # Try to assign people from each group
-            for group in self._groups.values():
-                if not group.members:
-                    continue
+        # Eligible members per group, kept up to date as people reach max_days
+        # instead of being re-filtered for every day
+        group_pools = [
+            (group, [
+                member for member in group.members
+                if len(member.assigned_dates) < member.max_days
+            ])
+            for group in self._groups.values()
+            if group.members
+        ]
+
+        # Format every date of the month once, up front
+        date_strs = [f"{year}-{month:02d}-{day:02d}" for day in range(1, num_days + 1)]
 
-                # Filter eligible members
-                eligible_members = [
-                    member for member in group.members
-                    if len(member.assigned_dates) < member.max_days
-                ]
+        # One uniform draw per pick; the pool size changes as members hit
+        # max_days, so indices cannot be drawn ahead of time
+        rand = random.random
+
+        # Generate assignments for each day
+        for date_str in date_strs:
+            day_assignments: List[str] = []
+            schedule.assignments[date_str] = day_assignments
 
+            # Try to assign people from each group
+            for group, eligible_members in group_pools:
                 if not eligible_members:
                     raise InsufficientGroupMembersError(
                         f"No eligible members available in group {group.id} for date {date_str}"
                     )
 
                 # Select a random member
-                selected_member = random.choice(eligible_members)
-                schedule.assignments[date_str].append(selected_member.name)
+                index = int(rand() * len(eligible_members))
+                selected_member = eligible_members[index]
+                day_assignments.append(selected_member.name)
                 selected_member.assigned_dates.append(date_str)
 
+                # Same name may be picked in several groups on one day
+                dates = person_dates.setdefault(selected_member.name, [])
+                if not dates or dates[-1] != date_str:
+                    dates.append(date_str)
+
+                # Drop members who reached their limit (order does not matter)
+                if len(selected_member.assigned_dates) >= selected_member.max_days:
+                    eligible_members[index] = eligible_members[-1]
+                    eligible_members.pop()
+
         self._current_schedule = schedule
+        self._person_dates = person_dates
         return schedule
\ No newline at end of file